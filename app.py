@@ -1,103 +1,587 @@
 import sys
-import json
-import requests
+import re
+import hashlib
+import sqlite3
+import threading
+import functools
+import importlib.util
+import queue
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                  QHBoxLayout, QTextEdit, QLabel, QPushButton,
                                  QFileDialog, QComboBox, QLineEdit, QMessageBox,
                                  QProgressBar, QDialog, QDialogButtonBox,
-                                 QFormLayout, QListWidget, QListWidgetItem)
-from PySide6.QtCore import Qt, QThread, Signal, QSettings
-from PySide6.QtGui import QIcon  # 导入 QIcon
-import qdarktheme
-from zhipuai import ZhipuAI
+                                 QFormLayout, QListWidget, QCheckBox, QSpinBox)
+from PySide6.QtCore import (Qt, QObject, QRunnable, QThreadPool, Signal, QSettings,
+                            QStandardPaths, QTimer)
+from PySide6.QtGui import QIcon, QTextCursor  # 导入 QIcon
 from datetime import datetime
 import os
 
 
+DEFAULT_CONCURRENT_TRANSLATIONS = 4  # 批量模式下同时进行的翻译请求数
+DEFAULT_RATE_LIMIT = 5  # 每秒最多发起的 GLM 请求数
+MAX_BATCH_FILES = 8  # 合并进同一次 GLM 请求的最大文件数
+MAX_OUTPUT_TOKENS = 4095  # glm-4-flash 单次回复的最大 token 数
+# 合并请求中歌词（含分隔行）的总字符上限，按 _max_output_tokens 的估算保证整包译文不超过回复上限
+MAX_PROMPT_CHARS = (MAX_OUTPUT_TOKENS - 256) // 2
+SAVE_FLUSH_SIZE = 16  # 批量模式下攒够多少个译文后统一写盘
+
+_PROMPT_INSTRUCTIONS = (
+    "**Translate the following lyrics EXCLUSIVELY into {target_lang}.**  "
+    "It is crucial that the translated lyrics are **entirely in {target_lang}**, with **no mixing of languages.** "
+    "Maintain the original poetic and emotional tone, ensuring grammatical correctness and natural flow – **all within the {target_lang} language only.** "
+    "Preserve the original formatting, including line breaks and any verse/chorus structure.\n\n"
+    "**Do NOT include any words, phrases, or sentences from the original language or any other language besides {target_lang} in the translation.**\n\n"
+)
+_PROMPT_TEMPLATE_PREFIX = _PROMPT_INSTRUCTIONS + "Lyrics to translate:\n"
+_BATCH_PROMPT_TEMPLATE_PREFIX = _PROMPT_INSTRUCTIONS + (
+    "The input below contains several independent songs, each introduced by a marker line such as ===FILE 1===. "
+    "Translate every song and reply with ONLY the translations, each introduced by the same marker line as its "
+    "original song, in the same order and with nothing else.\n\n"
+    "Songs to translate:\n"
+)
+_BATCH_MARKER_RE = re.compile(r"^===FILE (\d+)===[ \t]*$", re.MULTILINE)
+
+_TRUNCATED_WARNING = "The translation reached the output length limit and may be incomplete. It was not cached."
+_AUTH_ERROR_MSG = "Invalid API Key. Please check your API key in Settings."
+_RATE_LIMIT_ERROR_MSG = "API Rate Limit Exceeded. Please wait and try again later."
+# SDK 未抛出对应异常类型时，按服务端错误文本归类
+_API_ERROR_RE = re.compile(r"Invalid authentication credentials|Rate limit exceeded")
+_API_ERROR_MESSAGES = {
+    "Invalid authentication credentials": _AUTH_ERROR_MSG,
+    "Rate limit exceeded": _RATE_LIMIT_ERROR_MSG,
+}
+
+
+def _max_output_tokens(text):
+    # 按字符数而不是空格分词估算：中日韩歌词没有空格，按词数会严重低估译文长度导致截断
+    return min(MAX_OUTPUT_TOKENS, len(text) * 2 + 256)
+
+
+@functools.lru_cache(maxsize=32)
+def _prompt_prefix(target_lang):
+    """代入目标语言后的单文件提示词前缀，按语言缓存，保证每次请求的前缀逐字节一致"""
+    return _PROMPT_TEMPLATE_PREFIX.format(target_lang=target_lang)
+
+
+@functools.lru_cache(maxsize=32)
+def _batch_prompt_prefix(target_lang):
+    return _BATCH_PROMPT_TEMPLATE_PREFIX.format(target_lang=target_lang)
+
+
+def pack_batch(items, length_of, max_files=MAX_BATCH_FILES):
+    """按数量和字符数上限把条目依次打包，每包的歌词连同 ===FILE n=== 分隔行不超过 MAX_PROMPT_CHARS"""
+    group, size = [], 0
+    for item in items:
+        length = length_of(item) + len(f"===FILE {len(group) + 1}===\n") + 1
+        if group and (len(group) >= max_files or size + length > MAX_PROMPT_CHARS):
+            yield group
+            group, size = [], 0
+        group.append(item)
+        size += length
+    if group:
+        yield group
+
+
+def read_lyrics_file(path):
+    """一次读入全部字节再解码，省去文本模式逐块解码的开销；换行符与文本模式一样统一为 LF"""
+    text = Path(path).read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+@dataclass(frozen=True)
+class Settings:
+    api_key: str
+    rate_limit: int
+    concurrency: int
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings_store():
+    """进程内共享同一个 QSettings 对象，避免每次打开设置都重新创建"""
+    return QSettings("LyricsTranslatorPro", "Settings")
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings_snapshot():
+    """读取一次 QSettings 并缓存在内存中，保存设置后通过 cache_clear() 失效"""
+    settings = get_settings_store()
+    return Settings(api_key=settings.value("api_key", ""),
+                    rate_limit=settings.value("rate_limit", DEFAULT_RATE_LIMIT, type=int),
+                    concurrency=settings.value("concurrency", DEFAULT_CONCURRENT_TRANSLATIONS, type=int))
+
+
 class SettingsDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, cache=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
-        self.settings = QSettings("LyricsTranslatorPro", "Settings")
+        self.cache = cache
+        self.settings = get_settings_store()
+        snapshot = get_settings_snapshot()
+        self.new_api_key = ""
+        self.new_rate_limit = DEFAULT_RATE_LIMIT
+        self.new_concurrency = DEFAULT_CONCURRENT_TRANSLATIONS
 
         self.api_key_input = QLineEdit()
-        saved_api_key = self.settings.value("api_key", "")
-        self.api_key_input.setText(saved_api_key)
+        self.api_key_input.setText(snapshot.api_key)
         self.api_key_input.setEchoMode(QLineEdit.Password)
 
+        self.rate_limit_input = QSpinBox()
+        self.rate_limit_input.setRange(1, 50)
+        self.rate_limit_input.setSuffix(" req/s")
+        self.rate_limit_input.setValue(snapshot.rate_limit)
+
+        self.concurrency_input = QSpinBox()
+        self.concurrency_input.setRange(1, 16)
+        self.concurrency_input.setValue(snapshot.concurrency)
+
+        self.cache_age_input = QSpinBox()
+        self.cache_age_input.setRange(1, 3650)
+        self.cache_age_input.setValue(30)
+        self.cache_age_input.setSuffix(" days")
+        self.expire_cache_btn = QPushButton("Remove Older Entries")
+        self.expire_cache_btn.clicked.connect(self.expire_cache)
+        self.clear_cache_btn = QPushButton("Clear Cache")
+        self.clear_cache_btn.clicked.connect(self.clear_cache)
+        cache_layout = QHBoxLayout()
+        cache_layout.addWidget(self.cache_age_input)
+        cache_layout.addWidget(self.expire_cache_btn)
+        cache_layout.addWidget(self.clear_cache_btn)
+        for widget in [self.cache_age_input, self.expire_cache_btn, self.clear_cache_btn]:
+            widget.setEnabled(cache is not None)
+
         button_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.save_settings)
         button_box.rejected.connect(self.reject)
 
         layout = QFormLayout()
         layout.addRow(QLabel("GLM-4 API Key:"), self.api_key_input)
+        layout.addRow(QLabel("GLM-4 Rate Limit:"), self.rate_limit_input)
+        layout.addRow(QLabel("Concurrent Translations:"), self.concurrency_input)
+        layout.addRow(QLabel("Translation Cache:"), cache_layout)
         layout.addRow(button_box)
 
         self.setLayout(layout)
 
     def save_settings(self):
         api_key = self.api_key_input.text().strip()
+        rate_limit = self.rate_limit_input.value()
+        concurrency = self.concurrency_input.value()
+        # 直接把新值交给调用方，避免保存后再从 QSettings 读回
+        self.new_api_key = api_key
+        self.new_rate_limit = rate_limit
+        self.new_concurrency = concurrency
         self.settings.setValue("api_key", api_key)
+        self.settings.setValue("rate_limit", rate_limit)
+        self.settings.setValue("concurrency", concurrency)
+        get_settings_snapshot.cache_clear()
         self.accept()
 
-
-class TranslationWorker(QThread):
-    finished = Signal(str, str, str)
-    error = Signal(str, str)
+    def expire_cache(self):
+        deleted = self.cache.expire(self.cache_age_input.value())
+        QMessageBox.information(self, "Translation Cache", f"Removed {deleted} cached translations.")
+
+    def clear_cache(self):
+        deleted = self.cache.clear()
+        QMessageBox.information(self, "Translation Cache", f"Removed {deleted} cached translations.")
+
+
+class TokenBucket:
+    """线程安全的令牌桶，限制请求速率，令牌不足时阻塞等待"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class TranslationCache:
+    """基于 sqlite3 的译文缓存，键为 (引擎, 目标语言, 原文) 的 sha256；最近用过的条目另存一份在内存 LRU 中"""
+
+    def __init__(self, path, memory_size=512):
+        # 线程池中的所有 worker 共用一个连接，由锁保护
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_size = memory_size
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(engine, target_lang, text):
+        return hashlib.sha256(f"{engine}\x00{target_lang}\x00{text}".encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            row = self._conn.execute("SELECT value FROM translations WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._remember(key, row[0])
+        return row[0] if row else None
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            self._conn.execute("INSERT OR REPLACE INTO translations (key, value, ts) VALUES (?, ?, ?)",
+                               (key, value, int(time.time())))
+            self._conn.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def expire(self, max_age_days):
+        """删除早于 max_age_days 天写入的条目，返回删除的条数"""
+        cutoff = int(time.time()) - max_age_days * 86400
+        with self._lock:
+            self._memory.clear()
+            deleted = self._conn.execute("DELETE FROM translations WHERE ts < ?", (cutoff,)).rowcount
+            self._conn.commit()
+        return deleted
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            deleted = self._conn.execute("DELETE FROM translations").rowcount
+            self._conn.commit()
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class WorkerSignals(QObject):
+    finished = Signal(str, str, str, int)
+    error = Signal(str, str, int)
     progress = Signal(int)
+    partial = Signal(str, str)
+
 
-    def __init__(self, translator, text, target_lang, filename):
+class WarmupSignals(QObject):
+    ready = Signal(object)
+
+
+class GLMWarmupWorker(QRunnable):
+    """在后台创建 GLMTranslator 并发送一次极短的请求，提前完成 SDK 导入和 TLS 握手"""
+
+    def __init__(self, api_key, rate_limit):
         super().__init__()
+        self.signals = WarmupSignals()
+        self.api_key = api_key
+        self.rate_limit = rate_limit
+
+    def run(self):
+        try:
+            translator = GLMTranslator(self.api_key, rate_limit=self.rate_limit)
+        except Exception:
+            return  # 预热失败不影响正常翻译，真正翻译时会再报告错误
+        translator.warm_up()
+        self.signals.ready.emit(translator)
+
+
+class TranslationWorker(QRunnable):
+    def __init__(self, translator, text, target_lang, filename, index=-1, cache=None, use_cached=True,
+                 stream=False):
+        super().__init__()
+        self.signals = WorkerSignals()
         self.translator = translator
         self.text = text
         self.target_lang = target_lang
         self.filename = filename
+        self.index = index  # 批量模式下对应文件列表中的行号
+        self.cache = cache
+        self.use_cached = use_cached  # False 时跳过缓存读取，重新翻译并覆盖缓存
+        self.stream = stream  # 为 True 时通过 partial 信号逐段发出译文
+
+    def run(self):
+        text, filename, index = self.text, self.filename, self.index
+        try:
+            key, translated_text = self.cached_translation(text)
+            warning = ""
+            if translated_text is None:
+                self.signals.progress.emit(10)
+                on_delta = (lambda delta: self.signals.partial.emit(delta, filename)) if self.stream else None
+                translated_text, warning = self.translator.translate(text, self.target_lang, on_delta=on_delta)
+                self.signals.progress.emit(50)
+                if not warning:
+                    self.store_translation(key, translated_text)
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(translated_text, warning, filename, index)
+        except Exception as e:
+            self.signals.error.emit(str(e), filename, index)
+
+    def cached_translation(self, text):
+        """返回 (缓存键, 已缓存的译文)，未启用缓存时缓存键为 None"""
+        if self.cache is None:
+            return None, None
+        key = TranslationCache.make_key(self.translator.model, self.target_lang, text)
+        return key, self.cache.get(key) if self.use_cached else None
+
+    def store_translation(self, key, translated_text):
+        # 缓存只用于加速，写入失败（例如数据库被锁）时忽略，不影响已经拿到的译文
+        if key is None:
+            return
+        try:
+            self.cache.put(key, translated_text)
+        except sqlite3.Error:
+            pass
+
+
+class BatchTranslationWorker(TranslationWorker):
+    """从共享任务队列中持续取出一组 (行号, 文件路径) 进行翻译，取到 None 哨兵或批次被取消时退出"""
+
+    def __init__(self, translator, job_queue, target_lang, cache=None, use_cached=True, batch_results=None,
+                 cancel_event=None):
+        super().__init__(translator, None, target_lang, None, cache=cache, use_cached=use_cached)
+        self.job_queue = job_queue
+        # 同一批次所有 worker 共享的 {原文摘要: 译文}，内容相同的文件只翻译一次
+        self.batch_results = batch_results if batch_results is not None else {}
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
 
     def run(self):
+        while not self.cancel_event.is_set():
+            jobs = self.job_queue.get()
+            if jobs is None:
+                break
+            self.translate_group(jobs)
+
+    def read_job(self, filepath, filename, index):
         try:
-            translated_text = self.translator.translate(self.text, self.target_lang)
-            self.finished.emit(translated_text, "", self.filename)
+            text = read_lyrics_file(filepath)
         except Exception as e:
-            self.error.emit(str(e), self.filename)
+            self.signals.error.emit(f"Failed to open file {filename}:\n{str(e)}", filename, index)
+            return None
+        return text
+
+    def translate_group(self, jobs):
+        pending = []
+        duplicates = {}  # 原文摘要 -> 本组内内容相同的其他文件 [(行号, 文件名)]
+        for index, filepath in jobs:
+            if self.cancel_event.is_set():
+                return
+            filename = os.path.basename(filepath)
+            text = self.read_job(filepath, filename, index)
+            if text is None:
+                continue
+            if not text.strip():
+                # 空文件无需调用 API
+                self.signals.finished.emit(text, "", filename, index)
+                continue
+            digest = hashlib.sha256(text.encode('utf-8')).digest()
+            if digest in self.batch_results:
+                self.signals.finished.emit(self.batch_results[digest], "", filename, index)
+                continue
+            if digest in duplicates:
+                duplicates[digest].append((index, filename))
+                continue
+            try:
+                key, translated_text = self.cached_translation(text)
+            except Exception as e:
+                self.signals.error.emit(str(e), filename, index)
+                continue
+            if translated_text is not None:
+                self.batch_results[digest] = translated_text
+                self.signals.finished.emit(translated_text, "", filename, index)
+            else:
+                duplicates[digest] = []
+                pending.append((index, filename, text, key, digest))
+
+        for group in self._pack(pending):
+            # 每次请求前检查，取消后每个 worker 最多再完成手上的一个请求
+            if self.cancel_event.is_set():
+                return
+            try:
+                if len(group) == 1:
+                    results = [self.translator.translate(group[0][2], self.target_lang)]
+                else:
+                    results = self.translator.translate_many([item[2] for item in group], self.target_lang)
+            except Exception as e:
+                for index, filename, _, _, digest in group:
+                    for dup_index, dup_filename in [(index, filename)] + duplicates[digest]:
+                        self.signals.error.emit(str(e), dup_filename, dup_index)
+                continue
+            for (index, filename, _, key, digest), (translated_text, warning) in zip(group, results):
+                # 被截断的译文不写缓存，也不供后续内容相同的文件复用
+                if not warning:
+                    self.store_translation(key, translated_text)
+                    self.batch_results[digest] = translated_text
+                for dup_index, dup_filename in [(index, filename)] + duplicates[digest]:
+                    self.signals.finished.emit(translated_text, warning, dup_filename, dup_index)
+
+    @staticmethod
+    def _pack(pending):
+        """把未命中缓存的短文件打包，每包合并为一次请求"""
+        return pack_batch(pending, lambda item: len(item[2]))
 
 
 class GLMTranslator:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.client = ZhipuAI(api_key=api_key)
+    # 同一实例由所有并发 worker 共用：除 client 和线程安全的令牌桶外不保存任何逐次调用的状态
+    model = "glm-4-flash"
+    _shared_http_client = None
+    _shared_http_client_lock = threading.Lock()  # 预热线程和主线程可能同时创建客户端
 
-    def translate(self, text, target_lang):
+    def __init__(self, api_key, http_client=None, rate_limit=DEFAULT_RATE_LIMIT):
+        self.api_key = api_key
+        self.rate_limit = rate_limit
+        # zhipuai 会连带导入 httpx、pydantic 等，推迟到真正使用 GLM 时再导入以加快启动
+        from zhipuai import ZhipuAI
+
+        if http_client is None:
+            http_client = self.shared_http_client()
+        self.client = ZhipuAI(api_key=api_key, http_client=http_client)
+        # 并发 worker 共用同一个令牌桶，避免突发请求触发服务端限流
+        self._bucket = TokenBucket(rate=rate_limit, burst=rate_limit * 2)
+
+    @classmethod
+    def shared_http_client(cls):
+        """所有 GLMTranslator 共用的 httpx 连接池，保持长连接；安装了 h2 时启用 HTTP/2 多路复用"""
+        with cls._shared_http_client_lock:
+            if cls._shared_http_client is None:
+                import httpx
+
+                cls._shared_http_client = httpx.Client(
+                    http2=importlib.util.find_spec("h2") is not None,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=300),
+                )
+            return cls._shared_http_client
+
+    @classmethod
+    def close_shared_http_client(cls):
+        with cls._shared_http_client_lock:
+            if cls._shared_http_client is not None:
+                cls._shared_http_client.close()
+                cls._shared_http_client = None
+
+    def translate(self, text, target_lang, on_delta=None):
+        """返回 (译文, 警告)；回复被 max_tokens 截断时警告非空，调用方不应缓存该译文"""
+        if not text.strip():
+            return text, ""
+        content = _prompt_prefix(target_lang) + text
+        reply, truncated = self._complete(content, _max_output_tokens(text), on_delta)
+        return reply, _TRUNCATED_WARNING if truncated else ""
+
+    def translate_many(self, texts, target_lang):
+        """把多首歌词用 ===FILE n=== 分隔合并为一次请求，返回与 texts 顺序一致的 (译文, 警告) 列表；解析失败时逐个翻译"""
+        songs = "\n".join(f"===FILE {i}===\n{text}" for i, text in enumerate(texts, 1))
+        content = _batch_prompt_prefix(target_lang) + songs
+        reply, truncated = self._complete(content, _max_output_tokens(songs))
+        # 回复被 max_tokens 截断时最后一首会不完整，同样回退为逐个翻译
+        translations = None if truncated else self._parse_batch_response(reply, len(texts))
+        if translations is None:
+            return [self.translate(text, target_lang) for text in texts]
+        return [(translation, "") for translation in translations]
+
+    @staticmethod
+    def _parse_batch_response(reply, count):
+        parts = _BATCH_MARKER_RE.split(reply)
+        # parts 为 [前导内容, 编号1, 译文1, 编号2, 译文2, ...]，编号必须与请求一一对应
+        if [int(number) for number in parts[1::2]] != list(range(1, count + 1)):
+            return None
+        translations = [part.strip('\n') for part in parts[2::2]]
+        # 模型有时会用 ``` 代码块包裹整个回复
+        if parts[0].strip().startswith("```") and translations[-1].rstrip().endswith("```"):
+            translations[-1] = translations[-1].rstrip()[:-3].rstrip('\n')
+        return translations
+
+    def warm_up(self):
+        try:
+            self._bucket.acquire()
+            self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1,
+            )
+        except Exception:
+            pass
+
+    def _complete(self, content, max_tokens, on_delta=None):
+        """发起一次对话请求并返回 (回复, 是否因长度上限被截断)；提供 on_delta 时以流式方式接收，每收到一段译文就回调一次"""
         try:
+            self._bucket.acquire()
             response = self.client.chat.completions.create(
-                model="glm-4-flash",
+                model=self.model,
                 messages=[
                     {
                         "role": "user",
-                        "content": f"**Translate the following lyrics EXCLUSIVELY into {target_lang}.**  "
-                                    f"It is crucial that the translated lyrics are **entirely in {target_lang}**, with **no mixing of languages.** "
-                                    f"Maintain the original poetic and emotional tone, ensuring grammatical correctness and natural flow – **all within the {target_lang} language only.** "
-                                    f"Preserve the original formatting, including line breaks and any verse/chorus structure.\n\n"
-                                    f"**Do NOT include any words, phrases, or sentences from the original language or any other language besides {target_lang} in the translation.**\n\n"
-                                    f"Lyrics to translate:\n{text}"
+                        "content": content
                     }
                 ],
+                max_tokens=max_tokens,
+                temperature=0.3,
+                top_p=0.8,
+                stream=on_delta is not None,
         )
-            translated_text = response.choices[0].message.content
-            return translated_text
+            if on_delta is None:
+                choice = response.choices[0]
+                return choice.message.content, choice.finish_reason == "length"
+
+            parts = []
+            truncated = False
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+                    on_delta(choice.delta.content)
+                if choice.finish_reason == "length":
+                    truncated = True
+            return "".join(parts), truncated
         except Exception as e:
-            error_msg = f"API Error: {str(e)}"
-            if "Invalid authentication credentials" in str(e):
-                error_msg = "Invalid API Key. Please check your API key in Settings."
-            elif "Rate limit exceeded" in str(e):
-                error_msg = "API Rate Limit Exceeded. Please wait and try again later."
-            raise Exception(error_msg)
+            raise Exception(self._api_error_message(e))
+
+    @staticmethod
+    def _api_error_message(e):
+        from zhipuai import APIAuthenticationError, APIReachLimitError
+
+        if isinstance(e, APIAuthenticationError):
+            return _AUTH_ERROR_MSG
+        if isinstance(e, APIReachLimitError):
+            return _RATE_LIMIT_ERROR_MSG
+        match = _API_ERROR_RE.search(str(e))
+        if match:
+            return _API_ERROR_MESSAGES[match.group(0)]
+        return f"API Error: {str(e)}"
 
 
 class LocalTranslator:
-    def translate(self, text, target_lang):
-        lines = text.split('\n')
-        translated = [f"[{target_lang.upper()} {i + 1}] {line}" for i, line in enumerate(lines)]
-        return '\n'.join(translated)
+    model = "local"
+
+    def translate(self, text, target_lang, on_delta=None):
+        prefix = f"[{target_lang.upper()} "
+        return '\n'.join(f"{prefix}{i}] {line}" for i, line in enumerate(text.split('\n'), 1)), ""
+
+    def translate_many(self, texts, target_lang):
+        return [self.translate(text, target_lang) for text in texts]
 
 
 class TranslationApp(QMainWindow):
@@ -110,23 +594,69 @@ class TranslationApp(QMainWindow):
         self.setWindowTitle("Lyrics Translator Pro")
         self.setMinimumSize(800, 600) # 适当调整最小尺寸，可以根据你的喜好设置
 
-        self.settings = QSettings("LyricsTranslatorPro", "Settings")
-        self.api_key = self.settings.value("api_key", "")
+        snapshot = get_settings_snapshot()
+        self.api_key = snapshot.api_key
+        self.rate_limit = snapshot.rate_limit
+        self.concurrency = snapshot.concurrency
 
         self.translators = {
             "GLM-4-Flash": None,
             "Local Engine": LocalTranslator()
         }
+        # 复用同一个 GLM 客户端，避免每个文件都重新创建 ZhipuAI 实例
+        self._glm_translator = None
+        self._glm_key = None
+        self.translation_cache = self._open_translation_cache()
 
         self.file_paths = []
-        self.current_file_index = 0
+        self.completed_files = 0
         self.total_files = 0
+        self._job_queue = None
+        self._batch_cancel = None  # 当前批次的取消标志，关闭窗口时置位
+        self._batch_translator = None
+        self._batch_ts = ""
+        self._batch_target_lang = ""
+        self._pending_saves = []  # 待写盘的 (译文, 保存路径)
+        self._batch_preview_limit = 4096  # 批量完成后预览框中显示的最大字符数
+        self._last_batch_result = ""
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self.concurrency)
+        # 线程常驻不过期，后续批次无需重新创建线程
+        self.thread_pool.setExpiryTimeout(-1)
+
+        # 拖动调整窗口大小时合并多次 resizeEvent，停止拖动后再统一缩放字体
+        self._font_point_size = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self.apply_font_scaling)
+
+        # 翻译进行中每 50ms 合并刷新一次进度、列表状态和流式译文
+        self._pending_partial = []
+        self._pending_statuses = []  # [(行号, 状态文本)]
+        self._shown_completed_files = 0
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setInterval(50)
+        self._ui_flush_timer.timeout.connect(self._flush_ui_updates)
 
         self.init_ui()
         self.setup_styles()
         self.apply_font_scaling() # 初始应用字体缩放
+        QTimer.singleShot(0, self.warm_up_glm) # 窗口显示后再在后台预热 GLM 连接
+
+    def _open_translation_cache(self):
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            return TranslationCache(os.path.join(cache_dir, "translation_cache.sqlite3"))
+        except (OSError, sqlite3.Error):
+            # 缓存不可用时照常翻译，只是不做缓存
+            return None
 
     def setup_styles(self):
+        import qdarktheme
+
         qdarktheme.setup_theme("auto")
         self.setStyleSheet("""
             QTextEdit {
@@ -181,6 +711,9 @@ class TranslationApp(QMainWindow):
         ])
         self.lang_combo.setCurrentText("Chinese")
 
+        self.regenerate_check = QCheckBox("Regenerate")
+        self.regenerate_check.setToolTip("Ignore cached translations and translate again")
+
         self.settings_btn = QPushButton("⚙️ Settings")
         self.settings_btn.clicked.connect(self.open_settings)
 
@@ -189,6 +722,7 @@ class TranslationApp(QMainWindow):
         header_layout.addStretch()
         header_layout.addWidget(QLabel("Target Language:"))
         header_layout.addWidget(self.lang_combo)
+        header_layout.addWidget(self.regenerate_check)
         header_layout.addWidget(self.settings_btn)
 
         # Text Areas
@@ -259,9 +793,31 @@ class TranslationApp(QMainWindow):
         self.setCentralWidget(main_widget)
 
     def open_settings(self):
-        settings_dialog = SettingsDialog(self)
-        settings_dialog.exec()
-        self.api_key = self.settings.value("api_key", "")
+        settings_dialog = SettingsDialog(self, cache=self.translation_cache)
+        if settings_dialog.exec() == QDialog.Accepted:
+            self.api_key = settings_dialog.new_api_key
+            self.rate_limit = settings_dialog.new_rate_limit
+            self.concurrency = settings_dialog.new_concurrency
+            self.thread_pool.setMaxThreadCount(self.concurrency)
+            if self._glm_key != (self.api_key, self.rate_limit):
+                # API Key 或限速变化后立即丢弃旧客户端，不再持有失效的认证信息
+                self._glm_translator = None
+                self._glm_key = None
+                self.warm_up_glm()
+
+    def warm_up_glm(self):
+        if not self.api_key:
+            return
+        worker = GLMWarmupWorker(self.api_key, self.rate_limit)
+        worker.signals.ready.connect(self.handle_glm_warmed_up)
+        self.thread_pool.start(worker)
+
+    def handle_glm_warmed_up(self, translator):
+        glm_key = (translator.api_key, translator.rate_limit)
+        # 设置在预热期间发生变化，或翻译已先行创建了客户端时，丢弃预热结果
+        if self._glm_translator is None and glm_key == (self.api_key, self.rate_limit):
+            self._glm_translator = translator
+            self._glm_key = glm_key
 
     def open_files(self):
         file_paths, _ = QFileDialog.getOpenFileNames(
@@ -277,18 +833,24 @@ class TranslationApp(QMainWindow):
             if len(file_paths) > 1:
                 self.file_list_display.setVisible(True)
                 self.file_list_label.setVisible(True)
-                for path in file_paths:
-                    filename = os.path.basename(path)
-                    item = QListWidgetItem(filename)
-                    self.file_list_display.addItem(item)
+                # 一次性批量插入，避免每添加一项都触发重新布局和重绘
+                self.file_list_display.setUpdatesEnabled(False)
+                filenames = [os.path.basename(path) for path in file_paths]
+                self.file_list_display.addItems(filenames)
+                # 原始文件名存入 UserRole，状态文本始终由它生成；写入期间屏蔽逐项的 itemChanged 信号
+                self.file_list_display.blockSignals(True)
+                for index, filename in enumerate(filenames):
+                    self.file_list_display.item(index).setData(Qt.UserRole, filename)
+                self.file_list_display.blockSignals(False)
+                self.file_list_display.setUpdatesEnabled(True)
+                self.file_list_display.viewport().update()
 
                 QMessageBox.information(self, "Info", f"Opened {len(file_paths)} files for batch translation. Click 'Translate' to begin.")
             elif len(file_paths) == 1:
                 self.file_list_display.setVisible(False)
                 self.file_list_label.setVisible(False)
                 try:
-                    with open(file_paths[0], 'r', encoding='utf-8') as f:
-                        self.input_text.setPlainText(f.read())
+                    self.input_text.setPlainText(read_lyrics_file(file_paths[0]))
                     self.file_paths = []
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to open file:\n{str(e)}")
@@ -309,20 +871,34 @@ class TranslationApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file:\n{str(e)}")
 
-    def save_translated_file(self, translated_text, original_filename):
-        base, ext = os.path.splitext(original_filename)
-        target_lang = self.lang_combo.currentText()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        save_filename = f"{base}_{target_lang}_{timestamp}.lrc"
-        save_path = os.path.join(os.path.dirname(original_filename), save_filename)
+    def save_translated_file(self, translated_text, original_filename, index):
+        """生成批量译文的保存路径并加入待写队列，攒够一批后统一写盘"""
+        original = Path(original_filename)
+        # 同一批次共用一个时间戳，再用文件列表中的行号区分同名文件，序号不受完成顺序影响
+        save_path = original.with_name(
+            f"{original.stem}_{self._batch_target_lang}_{self._batch_ts}_{index + 1:03d}.lrc"
+        )
+
+        self._pending_saves.append((translated_text, save_path))
+        if len(self._pending_saves) >= SAVE_FLUSH_SIZE:
+            self._flush_pending_saves()
+        return save_path
 
-        try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                f.write(translated_text)
-            return True, save_path
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save translated file:\n{str(e)}")
-            return False, None
+    def _flush_pending_saves(self):
+        results, self._pending_saves = self._pending_saves, []
+        return self._save_file_bulk(results)
+
+    def _save_file_bulk(self, results):
+        failures = []
+        for translated_text, save_path in results:
+            try:
+                with open(save_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.write(translated_text)
+            except Exception as e:
+                failures.append(f"{save_path}: {str(e)}")
+        if failures:
+            QMessageBox.critical(self, "Error", "Failed to save translated file:\n" + "\n".join(failures))
+        return not failures
 
     def start_translation(self):
         engine = self.engine_combo.currentText()
@@ -354,10 +930,14 @@ class TranslationApp(QMainWindow):
             self.handle_error(str(e), "Single File Translation")
             return
 
-        self.worker = TranslationWorker(translator, text, target_lang, "single_file")
-        self.worker.finished.connect(self.handle_translation_result)
-        self.worker.error.connect(self.handle_error)
-        self.worker.start()
+        worker = TranslationWorker(translator, text, target_lang, "single_file",
+                                   cache=self.translation_cache,
+                                   use_cached=not self.regenerate_check.isChecked(), stream=True)
+        worker.signals.progress.connect(self.file_progress_bar.setValue)
+        worker.signals.partial.connect(self.handle_partial_result)
+        worker.signals.finished.connect(self.handle_translation_result)
+        worker.signals.error.connect(self.handle_error)
+        self.thread_pool.start(worker)
 
     def start_batch_translation(self, engine, target_lang, file_paths):
         self._prepare_ui_for_translation(is_batch=True)
@@ -368,67 +948,85 @@ class TranslationApp(QMainWindow):
 
         self.file_paths = file_paths
         self.total_files = len(file_paths)
-        self.current_file_index = 0
+        self.completed_files = 0
+        self._last_batch_result = ""
+        self._batch_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._batch_target_lang = self.lang_combo.currentText()
+        self._pending_saves = []
 
         self.overall_progress_bar.setRange(0, self.total_files)
         self.overall_progress_bar.setValue(0)
         self.overall_progress_label.setVisible(True)
         self.overall_progress_bar.setVisible(True)
+        self.current_file_label.setText(f"Processing Files: 0/{self.total_files}")
+        self.file_progress_label.setText(f"File Progress: Translating {self.total_files} files "
+                                         f"({self.concurrency} at a time)")
 
-        self.translate_next_file_in_batch(engine, target_lang)
-
-    def translate_next_file_in_batch(self, engine, target_lang):
-        if self.current_file_index < self.total_files:
-            filepath = self.file_paths[self.current_file_index]
-            filename = os.path.basename(filepath)
-
-            self.current_file_label.setText(f"Processing File: {filename}")
-            self.file_progress_label.setText(f"File Progress: Translating {filename} ({self.current_file_index + 1}/{self.total_files})")
-            self.file_progress_label.setVisible(True)
-            self.file_progress_bar.setVisible(True)
-            self.file_progress_bar.setRange(0, 0)
-
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                    self.input_text.setPlainText(text)
-
-                list_item = self.file_list_display.item(self.current_file_index)
-                list_item.setData(Qt.UserRole, filename)
-
-            except Exception as e:
-                self.handle_batch_error(f"Failed to open file {filename}:\n{str(e)}", filename)
-                return
-
-            try:
-                translator = self._create_translator_instance(engine)
-            except Exception as e:
-                self.handle_batch_error(str(e), filename)
-                return
+        try:
+            # 整个批次只校验 API Key 并获取一次翻译器，所有 worker 共用
+            self._batch_translator = self._create_translator_instance(engine)
+        except Exception as e:
+            for index, filepath in enumerate(file_paths):
+                self.handle_batch_error(str(e), os.path.basename(filepath), index)
+            return
 
-            self.worker = TranslationWorker(translator, text, target_lang, filename)
-            self.worker.finished.connect(self.handle_batch_translation_result)
-            self.worker.error.connect(self.handle_batch_error)
-            self.worker.start()
-        else:
-            self.batch_translation_finished()
+        # 所有文件分组放入任务队列，由固定数量的 worker 自行领取，主线程只负责更新界面
+        # 只把按文件大小估算能放进同一次请求的短文件归为一组，大文件各自单独入队，保证每个 worker 都有活干
+        max_files = max(1, min(MAX_BATCH_FILES, self.total_files // self.concurrency))
+        self._job_queue = queue.Queue()
+        for jobs in pack_batch(enumerate(file_paths), self._job_size, max_files):
+            self._job_queue.put(jobs)
+
+        batch_results = {}
+        self._batch_cancel = threading.Event()
+        worker_count = min(self.concurrency, self._job_queue.qsize())
+        for _ in range(worker_count):
+            self._job_queue.put(None)
+        for _ in range(worker_count):
+            worker = BatchTranslationWorker(self._batch_translator, self._job_queue, target_lang,
+                                            cache=self.translation_cache,
+                                            use_cached=not self.regenerate_check.isChecked(),
+                                            batch_results=batch_results, cancel_event=self._batch_cancel)
+            worker.signals.finished.connect(self.handle_batch_translation_result)
+            worker.signals.error.connect(self.handle_batch_error)
+            self.thread_pool.start(worker)
+
+    @staticmethod
+    def _job_size(job):
+        # UTF-8 文本的字节数不小于字符数，按文件大小估算不会让分组超出字符上限；无法读取的文件单独成组，由 worker 报告错误
+        try:
+            return os.path.getsize(job[1])
+        except OSError:
+            return MAX_PROMPT_CHARS
 
     def _create_translator_instance(self, engine):
         if engine == "GLM-4-Flash":
-            return GLMTranslator(self.api_key)
+            glm_key = (self.api_key, self.rate_limit)
+            if self._glm_translator is None or self._glm_key != glm_key:
+                self._glm_translator = GLMTranslator(self.api_key, rate_limit=self.rate_limit)
+                self._glm_key = glm_key
+            return self._glm_translator
         else:
             return self.translators[engine]
 
     def _prepare_ui_for_translation(self, is_batch=False):
         self.overall_progress_bar.setVisible(False)
         self.overall_progress_label.setVisible(False)
-        self.file_progress_bar.setVisible(True)
+        # 固定范围的进度条由 worker 的 progress 信号驱动，避免忙碌动画持续重绘；批量模式只显示总进度
+        self.file_progress_bar.setVisible(not is_batch)
         self.file_progress_label.setVisible(True)
-        self.file_progress_bar.setRange(0, 0)
+        self.file_progress_bar.setRange(0, 100)
+        self.file_progress_bar.setValue(0)
         self.set_buttons_enabled(False)
         self.output_text.clear()
-
-    def handle_translation_result(self, result, warning, filename):
+        self._pending_partial = []
+        self._pending_statuses = []
+        self._shown_completed_files = 0
+        self._ui_flush_timer.start()
+
+    def handle_translation_result(self, result, warning, filename, index=-1):
+        self._ui_flush_timer.stop()
+        self._pending_partial = []
         self.file_progress_bar.setVisible(False)
         self.file_progress_label.setVisible(False)
         self.set_buttons_enabled(True)
@@ -436,61 +1034,91 @@ class TranslationApp(QMainWindow):
         if warning:
             QMessageBox.warning(self, "Warning", warning)
 
-    def handle_batch_translation_result(self, result, warning, filename):
-        list_item = self.file_list_display.item(self.current_file_index)
-        if list_item:
-            original_filename = list_item.text()
-            list_item.setText(f"{original_filename} - Translated")
-
-        self.output_text.setPlainText(result)
-        success, save_path = self.save_translated_file(result, filename)
-        self.file_progress_bar.setVisible(False)
-        self.file_progress_label.setVisible(False)
+    def handle_partial_result(self, delta, filename):
+        self._pending_partial.append(delta)
+
+    def _flush_ui_updates(self):
+        """由 _ui_flush_timer 定时调用，把期间累积的界面更新一次性写入控件，避免高频信号逐条重绘"""
+        if self._pending_partial:
+            self.output_text.moveCursor(QTextCursor.End)
+            self.output_text.insertPlainText("".join(self._pending_partial))
+            self._pending_partial = []
+
+        if self._pending_statuses:
+            self.file_list_display.setUpdatesEnabled(False)
+            for index, status in self._pending_statuses:
+                list_item = self.file_list_display.item(index)
+                if list_item:
+                    list_item.setText(f"{list_item.data(Qt.UserRole)} - {status}")
+            self.file_list_display.setUpdatesEnabled(True)
+            self._pending_statuses = []
+
+        if self._shown_completed_files != self.completed_files:
+            self._shown_completed_files = self.completed_files
+            self.overall_progress_bar.setValue(self.completed_files)
+            self.current_file_label.setText(f"Processing Files: {self.completed_files}/{self.total_files}")
+
+    def handle_batch_translation_result(self, result, warning, filename, index):
+        self._pending_statuses.append((index, "Translated"))
+
+        # 批量过程中不刷新 QTextEdit，避免每个文件都重新排版整篇歌词
+        self._last_batch_result = result
+        self.save_translated_file(result, filename, index)
         if warning:
             QMessageBox.warning(self, "Warning", warning)
 
-        self.current_file_index += 1
-        self.overall_progress_bar.setValue(self.current_file_index)
-        engine = self.engine_combo.currentText()
-        target_lang = self.lang_combo.currentText().lower()
-        self.translate_next_file_in_batch(engine, target_lang)
+        self._batch_file_done()
 
-    def handle_error(self, error_msg, filename):
+    def handle_error(self, error_msg, filename, index=-1):
+        self._ui_flush_timer.stop()
+        self._pending_partial = []
         self.file_progress_bar.setVisible(False)
         self.file_progress_label.setVisible(False)
         self.set_buttons_enabled(True)
         QMessageBox.critical(self, "Error", f"Error during translation:\n{error_msg}")
 
-    def handle_batch_error(self, error_msg, filename):
-        list_item = self.file_list_display.item(self.current_file_index)
-        if list_item:
-            original_filename = list_item.text()
-            list_item.setText(f"{original_filename} - Error")
+    def handle_batch_error(self, error_msg, filename, index):
+        self._pending_statuses.append((index, "Error"))
 
-        self.file_progress_bar.setVisible(False)
-        self.file_progress_label.setVisible(False)
         QMessageBox.critical(self, "Batch Translation Error", f"Error processing file {filename}:\n{error_msg}")
-        self.current_file_index += 1
-        self.overall_progress_bar.setValue(self.current_file_index)
-        engine = self.engine_combo.currentText()
-        target_lang = self.lang_combo.currentText().lower()
-        self.translate_next_file_in_batch(engine, target_lang)
+        self._batch_file_done()
+
+    def _batch_file_done(self):
+        """结果在主线程按完成顺序到达，计数全部完成后结束批量任务"""
+        self.completed_files += 1
+        if self.completed_files >= self.total_files:
+            self.batch_translation_finished()
 
     def batch_translation_finished(self):
+        self._ui_flush_timer.stop()
+        self._flush_ui_updates()
         self.overall_progress_bar.setVisible(False)
         self.overall_progress_label.setVisible(False)
         self.file_progress_bar.setVisible(False)
         self.file_progress_label.setVisible(False)
         self.current_file_label.setVisible(False)
         self.file_list_label.setVisible(False)
+        self._flush_pending_saves()
         self.set_buttons_enabled(True)
+        # 截断的预览只放在输出框，输入框保持为空，避免再次点击翻译时把不完整的原文当作单文件翻译
+        self.output_text.setPlainText(self._preview_text(self._last_batch_result))
         QMessageBox.information(self, "Batch Translation", "Batch translation completed!")
         self.file_paths = []
         self.total_files = 0
-        self.current_file_index = 0
+        self.completed_files = 0
+        self._last_batch_result = ""
+        self._job_queue = None
+        self._batch_cancel = None
+        self._batch_translator = None
+
+    def _preview_text(self, text):
+        if len(text) <= self._batch_preview_limit:
+            return text
+        return text[:self._batch_preview_limit] + "…"
 
     def set_buttons_enabled(self, enabled):
-        for btn in [self.open_btn, self.translate_btn, self.settings_btn, self.engine_combo, self.lang_combo]:
+        for btn in [self.open_btn, self.translate_btn, self.settings_btn, self.engine_combo, self.lang_combo,
+                    self.regenerate_check]:
             btn.setEnabled(enabled)
 
     def apply_font_scaling(self):
@@ -499,20 +1127,40 @@ class TranslationApp(QMainWindow):
         base_width = 1200.0  # 你可以根据你的初始UI设计的宽度调整这个基准值
         scale_factor = max(0.5, window_width / base_width) # 缩放因子，最小0.5，避免字体过小
 
-        app_font = QApplication.font()
         default_font_size = 12 #  默认字体大小，与你的样式表中的基础字体大小一致
-        scaled_font_size = int(default_font_size * scale_factor)
-        app_font.setPointSize(max(8, scaled_font_size)) # 字体大小最小8，避免过小无法阅读
+        scaled_font_size = max(8, int(default_font_size * scale_factor)) # 字体大小最小8，避免过小无法阅读
+        if scaled_font_size == self._font_point_size:
+            return # 字号未变化时跳过全局 setFont，避免所有控件重新应用样式
+        self._font_point_size = scaled_font_size
+        app_font = QApplication.font()
+        app_font.setPointSize(scaled_font_size)
         QApplication.setFont(app_font)
 
+    def _cancel_pending_jobs(self):
+        """通知批量 worker 停止领取新任务，关闭时每个 worker 只需完成正在进行的那个请求"""
+        if self._batch_cancel is not None:
+            self._batch_cancel.set()
+
+    def closeEvent(self, event):
+        self._cancel_pending_jobs()
+        self.thread_pool.waitForDone()
+        # 等待期间完成的译文还在事件队列里，先派发出去再统一写盘，否则这些已付费的结果会丢失
+        QApplication.sendPostedEvents()
+        self._flush_pending_saves()
+        if self.translation_cache is not None:
+            self.translation_cache.close()
+        GLMTranslator.close_shared_http_client()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """窗口大小改变事件处理器，重新应用字体缩放"""
         super().resizeEvent(event)
-        self.apply_font_scaling()
+        self._resize_timer.start()
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setApplicationName("LyricsTranslatorPro")
 
     app_icon = QIcon("./lyric_translate.ico") # 创建 QApplication 的 QIcon 对象
     app.setWindowIcon(app_icon) # 设置 QApplication 的窗口图标